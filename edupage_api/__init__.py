@@ -166,6 +166,9 @@ class Edupage(EdupageModule):
     def get_meals(self, date: date) -> Optional[Meals]:
         """Get lunches.
 
+        The whole week is cached for 60 seconds. Choosing a meal, rating it,
+        or calling `Edupage.clear_meals_cache` drops the cached weeks of this account.
+
         Args:
             date (datetime.date): Date from which you want to get lunches.
 
@@ -175,6 +178,25 @@ class Edupage(EdupageModule):
 
         return Lunches(self).get_meals(date)
 
+    def clear_meals_cache(self):
+        """Drop the cached lunches of this account, so they are downloaded again."""
+
+        Lunches(self).clear_cache()
+
+    def get_meals_many(self, dates: list[date]) -> dict[date, Optional[Meals]]:
+        """Get lunches for multiple dates, requesting them concurrently.
+
+        Dates from the same week share a single request.
+
+        Args:
+            dates (list[datetime.date]): Dates from which you want to get lunches.
+
+        Returns:
+            dict[datetime.date, Optional[Meals]]: Lunches for each of the entered dates.
+        """
+
+        return Lunches(self).get_meals_many(dates)
+
     def get_notifications(self) -> list[TimelineEvent]:
         """Get list of all available notifications.
 
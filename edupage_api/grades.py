@@ -35,8 +35,8 @@ class Term(Enum):
 
 class Grades(Module):
     def __parse_grade_data(self, data: str) -> dict:
-        json_string = data.split(".znamkyStudentViewer(")[1].split(
-            ");\r\n\t\t});\r\n\t\t</script>"
+        json_string = data.split(".znamkyStudentViewer(", 1)[1].split(
+            ");\r\n\t\t});\r\n\t\t</script>", 1
         )[0]
 
         return json.loads(json_string)
@@ -132,7 +132,7 @@ class Login(Module):
         self.edupage.data = json.loads(json_string)
         self.edupage.is_logged_in = True
 
-        self.edupage.gsec_hash = data.split('ASC.gsechash="')[1].split('"')[0]
+        self.edupage.gsec_hash = data.split('ASC.gsechash="', 1)[1].split('"', 1)[0]
 
     def login(
         self, username: str, password: str, subdomain: str = "login1"
@@ -166,7 +166,7 @@ class Login(Module):
         response = self.edupage.session.get(request_url)
         data = response.content.decode()
 
-        csrf_token = data.split('"csrftoken":"')[1].split('"')[0]
+        csrf_token = data.split('"csrftoken":"', 1)[1].split('"', 1)[0]
 
         parameters = {
             "csrfauth": csrf_token,
@@ -187,7 +187,7 @@ class Login(Module):
         data = response.content.decode()
 
         if subdomain == "login1":
-            subdomain = data.split("-->")[0].split(" ")[-1]
+            subdomain = data.split("-->", 1)[0].split(" ")[-1]
 
         self.edupage.subdomain = subdomain
         self.edupage.username = username
@@ -205,10 +205,10 @@ class Login(Module):
 
         data = two_factor_response.content.decode()
 
-        csrf_token = data.split('csrfauth" value="')[1].split('"')[0]
+        csrf_token = data.split('csrfauth" value="', 1)[1].split('"', 1)[0]
 
-        authentication_token = data.split('au" value="')[1].split('"')[0]
-        authentication_endpoint = data.split('gu" value="')[1].split('"')[0]
+        authentication_token = data.split('au" value="', 1)[1].split('"', 1)[0]
+        authentication_endpoint = data.split('gu" value="', 1)[1].split('"', 1)[0]
 
         return TwoFactorLogin(
             authentication_endpoint, authentication_token, csrf_token, self.edupage
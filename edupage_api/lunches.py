@@ -1,8 +1,15 @@
+import copy
 import json
+import sys
+import threading
+import time
+from collections import ChainMap, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from typing import List, Optional
 from enum import Enum
+from functools import lru_cache
 
 from edupage_api.exceptions import (
     FailedToChangeMealError,
@@ -11,10 +18,23 @@ from edupage_api.exceptions import (
     NotLoggedInException,
 )
 from edupage_api.module import EdupageModule, Module, ModuleHelper
-import copy, re
 
+try:
+    import orjson
 
-@dataclass
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+# dataclasses support __slots__ only since Python 3.10
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Rating:
     __date: str
     __boarder_id: str
@@ -41,14 +61,16 @@ class Rating:
         }
 
         response = edupage.session.post(request_url, data=data)
-        parsed_response = json.loads(response.content.decode())
+        parsed_response = _json_loads(response.content)
 
         error = parsed_response.get("error")
         if error is None or error != "":
             raise FailedToRateException()
 
+        Lunches(edupage).clear_cache()
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Menu:
     name: str
     allergens: str
@@ -61,7 +83,7 @@ class MealType(Enum):
     LUNCH = 2
     AFTERNOON_SNACK = 4
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Meal:
     served_from: Optional[datetime]
     served_to: Optional[datetime]
@@ -92,18 +114,16 @@ class Meal:
 
         data = {
             "akcia": "ulozJedlaStravnika",
-            "jedlaStravnika": json.dumps(boarder_menu),
+            "jedlaStravnika": _json_dumps(boarder_menu),
         }
 
-        response = edupage.session.post(
-            request_url, data=data
-        ).content.decode()
-
-
+        response = edupage.session.post(request_url, data=data).content
 
-        if json.loads(response).get("error") != "":
+        if _json_loads(response).get("error") != "":
             raise FailedToChangeMealError()
 
+        Lunches(edupage).clear_cache()
+
     def choose(self, edupage: EdupageModule, number: int):
         letters = "ABCDEFGH"
         letter = letters[number - 1]
@@ -115,122 +135,236 @@ class Meal:
         self.__make_choice(edupage, "AX")
         self.ordered_meal = None
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Meals:
     snack: Optional[Meal]
     lunch: Optional[Meal]
     afternoon_snack: Optional[Meal]
-    
 
+    @property
+    def by_type(self) -> dict[MealType, Optional[Meal]]:
+        return {
+            MealType.SNACK: self.snack,
+            MealType.LUNCH: self.lunch,
+            MealType.AFTERNOON_SNACK: self.afternoon_snack,
+        }
 
-class Lunches(Module):
-    @ModuleHelper.logged_in
-    def get_meals(self, date: date) -> Optional[Meals]:
-        date_strftime = date.strftime("%Y%m%d")
-        request_url = f"https://{self.edupage.subdomain}.edupage.org/menu/?date={date_strftime}"
-        response = self.edupage.session.get(request_url).content.decode()
 
-        lunch_data = json.loads(
-            response.split("edupageData: ")[1].split(",\r\n")[0]
-        )
+# upper bound of parallel requests made by `Lunches.get_meals_many`
+_MAX_CONCURRENT_REQUESTS = 5
 
-        root = lunch_data.get("robotnik", {}).get("novyListok", lunch_data.get("robotnik", lunch_data))
+# `Lunches.get_meals` results are cached per account and day for a short time
+_MEALS_CACHE_SIZE = 64
+_MEALS_CACHE_TTL = 60  # seconds
+
+_meals_cache = OrderedDict()
+_meals_cache_lock = threading.Lock()
 
-        monday = date - timedelta(days=date.weekday())
-        week_keys = [(monday + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(5)]
+_DATA_START = b"edupageData: "
+_DATA_END = b",\r\n"
 
-        _ALLOWED_CHARS = re.compile(r"[^A-Za-z0-9čšžľřťďňéŕýúíóáĺäôČŠŽĽŘŤĎŇÉŔÝÚÍÓÁĹÄÔ\s]+")
+_ALLOWED_CHARS = frozenset(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+    "čšžľřťďňéŕýúíóáĺäôČŠŽĽŘŤĎŇÉŔÝÚÍÓÁĹÄÔ"
+)
 
-        def _clean_name(name: str) -> str:
-            """Remove disallowed chars, 'I.' tokens, and trim spaces."""
-            if not isinstance(name, str):
-                return ""
-            name = name.replace("I.", "")
-            name = _ALLOWED_CHARS.sub("", name)
-            return name.strip()
 
-        def _extract_primary_day(obj):
-            if not isinstance(obj, dict):
-                return {"isCooking": False}
+class _NameTranslationTable(dict):
+    """`str.translate` table that drops disallowed chars, filled on first encounter."""
 
-            if "2" in obj and isinstance(obj["2"], dict):
-                merged = copy.deepcopy(obj["2"])
-            else:
-                merged = {}
-                for k in ("2", "0", "4"):
-                    if k in obj and isinstance(obj[k], dict):
-                        merged.update(copy.deepcopy(obj[k]))
+    def __missing__(self, code: int) -> Optional[int]:
+        char = chr(code)
+        value = code if char in _ALLOWED_CHARS or char.isspace() else None
+        self[code] = value
+        return value
+
+
+_NAME_TABLE = _NameTranslationTable()
+
+
+@lru_cache(maxsize=1024)
+def _clean_str(name: str) -> str:
+    return name.replace("I.", "").translate(_NAME_TABLE).strip()
+
+
+def _clean_name(name: str) -> str:
+    """Remove disallowed chars, 'I.' tokens, and trim spaces."""
+    if not isinstance(name, str):
+        return ""
+    return _clean_str(name)
+
+
+def _week_start(day: date) -> date:
+    """Return the monday of the week `day` is in."""
+    if isinstance(day, datetime):
+        # isoformat of a datetime would include the time
+        day = day.date()
+    return day - timedelta(days=day.weekday())
+
+
+_WEIGHT_KEYS = ("hmotnostiStr", "hmotnostStr", "hmotnosti", "hmotnost")
 
-            merged.pop("nevarisa", None)
 
-            if not merged.get("isCooking"):
-                return {"isCooking": False}
+def _parse_weight(row: dict) -> Optional[int]:
+    """Parse the weight of a menu row from the first weight key that is set."""
+    for key in _WEIGHT_KEYS:
+        value = row.get(key)
+        if value is None:
+            continue
 
-            out = {"isCooking": True}
-            if "isRating" in merged:
-                out["isRating"] = merged["isRating"]
+        if type(value) is int:
+            return value
 
+        try:
+            if type(value) is float:
+                return int(value)
+
+            value = str(value).strip()
+            return int(value) if value.isdigit() else int(float(value))
+        except Exception:
+            return None
+
+    return None
+
+
+def _extract_primary_day(obj):
+    if not isinstance(obj, dict):
+        return {"isCooking": False}
+
+    src = obj.get("2")
+    if not isinstance(src, dict):
+        # no primary meal, look the keys up in the other meals instead
+        sources = [obj[k] for k in ("4", "0") if isinstance(obj.get(k), dict)]
+        if not sources:
+            return {"isCooking": False}
+        src = sources[0] if len(sources) == 1 else ChainMap(*sources)
+
+    if not src.get("isCooking"):
+        return {"isCooking": False}
+
+    pick_val = 0
+    evidencia = src.get("evidencia", {})
+    if isinstance(evidencia, dict):
+        obj_code = evidencia.get("obj")
+        stav = evidencia.get("stav")
+        if stav == "X":
             pick_val = 0
-            evidencia = merged.get("evidencia", {})
-            if isinstance(evidencia, dict):
-                obj_code = evidencia.get("obj")
-                stav = evidencia.get("stav")
-                if stav == "X":
-                    pick_val = 0
-                elif obj_code == "A":
-                    pick_val = 1
-                elif obj_code == "B":
-                    pick_val = 2
-            out["pick"] = pick_val
-
-            menus_out = {}
-            menus = merged.get("menus", {}) or {}
-            for mid in ("1", "2"):
-                rows = menus.get(mid, {}).get("rows", []) if isinstance(menus.get(mid, {}), dict) else []
-                cleaned = []
-                for r in rows:
-                    nm = _clean_name(r.get("nazov", ""))
-                    if not nm:
-                        continue
-                    wv = None
-                    for wk in ("hmotnostiStr", "hmotnostStr", "hmotnosti", "hmotnost"):
-                        if wk in r and r[wk] is not None:
-                            try:
-                                wv = int(float(str(r[wk]).strip()))
-                            except Exception:
-                                pass
-                            break
-                    cleaned.append({"name": nm, "weight": wv or 0})
-                menus_out[mid] = cleaned
-            out["menus"] = menus_out
-
-            hodnotenia = merged.get("hodnotenia", {}) or {}
-            reviews_out = {}
-            for mid in ("1", "2"):
-                arr = hodnotenia.get(mid)
-                if arr and isinstance(arr, list) and len(arr) > 0:
-                    pr_list = []
-                    for it in arr:
-                        if it is None:
-                            continue
-                        pr = it.get("priemer")
-                        if pr is None:
-                            continue
-                        try:
-                            pr_list.append(float(pr))
-                        except Exception:
-                            pass
-                    avg = round(sum(pr_list) / len(pr_list), 2) if pr_list else -1.0
-                    try:
-                        amount = int(arr[0].get("pocet", 0))
-                    except Exception:
-                        amount = 0
-                    reviews_out[mid] = {"average": avg, "amount": amount}
-                else:
-                    reviews_out[mid] = {"average": -1, "amount": 0}
-            out["reviews"] = reviews_out
-
-            return out
+        elif obj_code == "A":
+            pick_val = 1
+        elif obj_code == "B":
+            pick_val = 2
+
+    menus_out = {}
+    menus = src.get("menus", {}) or {}
+    # bind the helpers locally, the row loop is the hot path of get_meals
+    clean_name = _clean_name
+    parse_weight = _parse_weight
+    for mid in ("1", "2"):
+        menu = menus.get(mid, {})
+        rows = menu.get("rows", []) if isinstance(menu, dict) else []
+        cleaned = []
+        cleaned_append = cleaned.append
+        for r in rows:
+            nm = clean_name(r.get("nazov", ""))
+            if not nm:
+                continue
+            cleaned_append({"name": nm, "weight": parse_weight(r) or 0})
+        menus_out[mid] = cleaned
+
+    hodnotenia = src.get("hodnotenia", {}) or {}
+    reviews_out = {}
+    for mid in ("1", "2"):
+        arr = hodnotenia.get(mid)
+        if arr and isinstance(arr, list) and len(arr) > 0:
+            total = 0.0
+            count = 0
+            for it in arr:
+                if it is None:
+                    continue
+                pr = it.get("priemer")
+                if pr is None:
+                    continue
+                try:
+                    total += float(pr)
+                    count += 1
+                except Exception:
+                    pass
+            avg = round(total / count, 2) if count else -1.0
+            try:
+                amount = int(arr[0].get("pocet", 0))
+            except Exception:
+                amount = 0
+            reviews_out[mid] = {"average": avg, "amount": amount}
+        else:
+            reviews_out[mid] = {"average": -1, "amount": 0}
+
+    out = {"isCooking": True, "pick": pick_val, "menus": menus_out, "reviews": reviews_out}
+    if "isRating" in src:
+        out["isRating"] = src["isRating"]
+
+    return out
+
+
+class Lunches(Module):
+    def clear_cache(self):
+        """Drop the cached `get_meals` results of the current account.
+
+        Cached weeks of other accounts are kept.
+        """
+        account = (self.edupage.subdomain, self.edupage.username)
+        with _meals_cache_lock:
+            for key in [key for key in _meals_cache if key[:2] == account]:
+                del _meals_cache[key]
+
+    @staticmethod
+    def __get_cached(key: tuple):
+        with _meals_cache_lock:
+            entry = _meals_cache.get(key)
+            if entry is None:
+                return None
+
+            expires_at, meals = entry
+            if expires_at < time.monotonic():
+                del _meals_cache[key]
+                return None
+
+            _meals_cache.move_to_end(key)
+
+        # cached weeks are never handed out, callers may modify their copy
+        return copy.deepcopy(meals)
+
+    @staticmethod
+    def __set_cached(key: tuple, meals):
+        with _meals_cache_lock:
+            _meals_cache[key] = (time.monotonic() + _MEALS_CACHE_TTL, meals)
+            _meals_cache.move_to_end(key)
+            while len(_meals_cache) > _MEALS_CACHE_SIZE:
+                _meals_cache.popitem(last=False)
+
+    @ModuleHelper.logged_in
+    def get_meals(self, date: date) -> Optional[Meals]:
+        # the response always covers the whole week, so cache it per week
+        monday = _week_start(date)
+        cache_key = (self.edupage.subdomain, self.edupage.username, monday.toordinal())
+        cached = Lunches.__get_cached(cache_key)
+        if cached is not None:
+            return cached
+
+        date_strftime = date.strftime("%Y%m%d")
+        request_url = f"https://{self.edupage.subdomain}.edupage.org/menu/?date={date_strftime}"
+        response = self.edupage.session.get(request_url).content
+
+        start = response.find(_DATA_START)
+        if start == -1:
+            raise InvalidMealsData("Lunch data not found in the response!")
+        start += len(_DATA_START)
+
+        end = response.find(_DATA_END, start)
+        lunch_data = _json_loads(response[start:end] if end != -1 else response[start:])
+
+        root = lunch_data.get("robotnik", {}).get("novyListok", lunch_data.get("robotnik", lunch_data))
+
+        week_keys = [(monday + timedelta(days=i)).isoformat() for i in range(5)]
 
         result = {}
         for wk in week_keys:
@@ -263,4 +397,19 @@ class Lunches(Module):
                     info["user"] = user
             result["info"] = info
 
+        Lunches.__set_cached(cache_key, copy.deepcopy(result))
         return result
+
+    @ModuleHelper.logged_in
+    def get_meals_many(self, dates: list[date]) -> dict[date, Optional[Meals]]:
+        # every response covers a whole week, so request each week only once
+        week_by_date = {day: _week_start(day) for day in dates}
+        weeks = list(dict.fromkeys(week_by_date.values()))
+        if not weeks:
+            return {}
+
+        workers = min(_MAX_CONCURRENT_REQUESTS, len(weeks))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            meals_by_week = dict(zip(weeks, executor.map(self.get_meals, weeks)))
+
+        return {day: meals_by_week[week] for day, week in week_by_date.items()}
@@ -69,7 +69,7 @@ class ModuleHelper:
     @staticmethod
     def encode_form_data(data: dict) -> str:
         output = ""
-        for i, key in enumerate(data.keys(), start=0):
+        for i, key in enumerate(data, start=0):
             value = data[key]
             entry = f"{ModuleHelper.urlencode(key)}={ModuleHelper.urlencode(value)}"
 
@@ -55,9 +55,9 @@ class Substitution(Module):
     @ModuleHelper.logged_in
     def get_missing_teachers(self, date: date) -> Optional[list[EduTeacher]]:
         html = self.__get_substitution_data(date)
-        missing_teachers_string = html.split('<span class="print-font-resizable">')[
+        missing_teachers_string = html.split('<span class="print-font-resizable">', 1)[
             1
-        ].split("</span>")[0]
+        ].split("</span>", 1)[0]
 
         if not missing_teachers_string:
             return None
@@ -42,7 +42,7 @@ class Lesson:
 
         response = edupage.session.get(request_url)
 
-        gse_hash = response.content.decode().split("gsechash=")[1].split('"')[1]
+        gse_hash = response.content.decode().split("gsechash=", 1)[1].split('"', 2)[1]
 
         request_url = f"https://{edupage.subdomain}.edupage.org/dashboard/server/onlinelesson.js?__func=getOnlineLessonOpenUrl"
         today = datetime.today()
@@ -151,8 +151,8 @@ class Timetables(Module):
         )
         csrf_response = self.edupage.session.get(csrf_request_url)
 
-        gpid = csrf_response.text.split("gpid=")[1].split("&")[0]
-        gsh = csrf_response.text.split("gsh=")[1].split('"')[0]
+        gpid = csrf_response.text.split("gpid=", 1)[1].split("&", 1)[0]
+        gsh = csrf_response.text.split("gsh=", 1)[1].split('"', 1)[0]
 
         next_gpid = int(gpid) + 1
 
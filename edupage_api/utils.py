@@ -94,7 +94,7 @@ class RequestUtil:
     @staticmethod
     def encode_form_data(data):
         output = ""
-        for i, key in enumerate(data.keys(), start=0):
+        for i, key in enumerate(data, start=0):
             value = data[key]
             entry = f"{RequestUtil.urlencode(key)}={RequestUtil.urlencode(value)}"
 